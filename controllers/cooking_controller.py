@@ -9,10 +9,11 @@ This controller handles:
 """
 
 import streamlit as st
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Optional
 
-from services.claude_service import ClaudeService
+from services.claude_service import ClaudeService, recording_reply, relay_reply
 from services.recipe_service import RecipeService, RecipeSummary
 from services.audio_service import AudioService
 from config.database import SessionLocal
@@ -31,6 +32,7 @@ from models.user_preferences import (
 # Rate limit configuration
 RATE_LIMIT_MAX_REQUESTS = 30
 RATE_LIMIT_WINDOW_SECONDS = 60
+RATE_LIMIT_MESSAGE = "Too many requests. Please wait a moment."
 
 
 class CookingController:
@@ -40,6 +42,14 @@ class CookingController:
         self.claude = ClaudeService()
         self.recipes = RecipeService()
         self.audio = AudioService()
+
+    def init_session(self):
+        """
+        Prepare the current user's session state.
+
+        The controller itself holds only service clients and is shared
+        across sessions, so views call this on every run.
+        """
         self._init_session_state()
         self._load_user_preferences()
 
@@ -57,6 +67,7 @@ class CookingController:
                 "messages": [],
                 "audio_key": 0,
                 "pending_audio": None,
+                "pending_prompt": None,
                 "voice_name": DEFAULT_VOICE_NAME,
                 "voice_rate": DEFAULT_VOICE_RATE,
                 "preferences_loaded": False,
@@ -241,28 +252,19 @@ class CookingController:
         ]
         return True
 
-    def send_discovery_message(self, text: str) -> tuple[bool, Optional[str]]:
-        """
-        Send a message in discovery mode.
-
-        Returns (success, error_message)
-        """
-        if not self._check_rate_limit():
-            return False, "Too many requests. Please wait a moment."
-
+    def _stream_discovery_reply(self, text: str) -> Iterator[str]:
+        """Stream Claude's discovery reply, recording it as it arrives."""
         state = st.session_state.cooking
         recipe_list = self._get_recipe_list_for_claude()
+        messages = state["discovery_messages"]
+        history = list(messages)
 
         # Get Claude response
-        response_text, selected_recipe_id = self.claude.chat_discovery(
-            text,
-            recipe_list,
-            state["discovery_messages"]
-        )
-
-        # Update message history
-        state["discovery_messages"].append({"role": "user", "content": text})
-        state["discovery_messages"].append({"role": "assistant", "content": response_text})
+        with recording_reply(messages, text) as reply:
+            response_text, selected_recipe_id = yield from relay_reply(
+                self.claude.stream_discovery(text, recipe_list, history),
+                reply,
+            )
 
         # Generate TTS audio for the response
         self._generate_response_audio(response_text)
@@ -271,20 +273,6 @@ class CookingController:
         if selected_recipe_id:
             self.start_session(selected_recipe_id)
 
-        return True, None
-
-    def handle_discovery_voice_input(self, audio_bytes: bytes) -> tuple[bool, Optional[str]]:
-        """
-        Process voice input in discovery mode.
-
-        Returns (success, error_message)
-        """
-        text = self.audio.transcribe(audio_bytes)
-        if not text:
-            return False, "Could not understand audio. Please try again."
-
-        return self.send_discovery_message(text)
-
     # Session lifecycle
     def start_session(self, recipe_id: int) -> bool:
         """
@@ -316,6 +304,7 @@ class CookingController:
             ],
             "audio_key": 0,
             "pending_audio": None,
+            "pending_prompt": None,
             "voice_name": st.session_state.cooking.get("voice_name", DEFAULT_VOICE_NAME),
             "voice_rate": st.session_state.cooking.get("voice_rate", DEFAULT_VOICE_RATE),
             "preferences_loaded": True,  # Keep loaded state
@@ -336,47 +325,70 @@ class CookingController:
             "messages": [],
             "audio_key": 0,
             "pending_audio": None,
+            "pending_prompt": None,
             "voice_name": st.session_state.cooking.get("voice_name", DEFAULT_VOICE_NAME),
             "voice_rate": st.session_state.cooking.get("voice_rate", DEFAULT_VOICE_RATE),
             "preferences_loaded": True,  # Keep loaded state
         }
 
     # Message handling
-    def handle_voice_input(self, audio_bytes: bytes) -> tuple[bool, Optional[str]]:
+    def queue_message(self, text: str):
+        """Queue a message; its reply is streamed by take_pending_reply()."""
+        st.session_state.cooking["pending_prompt"] = text
+
+    def take_pending_reply(self) -> Optional[tuple[str, Iterator[str]]]:
         """
-        Process voice input.
+        Take the queued message and start Claude's reply to it.
 
-        Returns (success, error_message)
+        Returns (message, reply chunks), or None if nothing is queued.
+        The exchange is added to history as the chunks are consumed; TTS
+        audio and any recipe selection are applied once they are done.
         """
-        text = self.audio.transcribe(audio_bytes)
+        state = st.session_state.cooking
+        text = state.get("pending_prompt")
         if not text:
-            return False, "Could not understand audio. Please try again."
+            return None
+        state["pending_prompt"] = None
+
+        if not self._check_rate_limit():
+            messages = state["messages"] if state["active"] else state["discovery_messages"]
+            return text, self._rate_limited_reply(messages, text)
 
-        return self.send_message(text)
+        if state["active"]:
+            return text, self._stream_reply(text)
+        return text, self._stream_discovery_reply(text)
 
-    def send_message(self, text: str) -> tuple[bool, Optional[str]]:
+    @staticmethod
+    def _rate_limited_reply(messages: list[dict], text: str) -> Iterator[str]:
+        """Keep a rate-limited message in history and show the limit notice."""
+        messages.append({"role": "user", "content": text})
+        yield RATE_LIMIT_MESSAGE
+
+    def handle_voice_input(self, audio_bytes: bytes) -> tuple[bool, Optional[str]]:
         """
-        Send a message to Claude.
+        Process voice input (discovery or cooking) by queueing its transcript.
 
         Returns (success, error_message)
         """
-        if not self._check_rate_limit():
-            return False, "Too many requests. Please wait a moment."
+        text = self.audio.transcribe(audio_bytes)
+        if not text:
+            return False, "Could not understand audio. Please try again."
 
+        self.queue_message(text)
+        return True, None
+
+    def _stream_reply(self, text: str) -> Iterator[str]:
+        """Stream Claude's cooking reply, recording it as it arrives."""
         state = st.session_state.cooking
+        messages = state["messages"]
+        history = list(messages)
 
         # Get Claude response
-        response = self.claude.chat_cooking(
-            text,
-            state["recipe_context"],
-            state["messages"]
-        )
-
-        # Update message history
-        state["messages"].append({"role": "user", "content": text})
-        state["messages"].append({"role": "assistant", "content": response})
+        with recording_reply(messages, text) as reply:
+            response = yield from relay_reply(
+                self.claude.stream_cooking(text, state["recipe_context"], history),
+                reply,
+            )
 
         # Generate TTS audio for the response
         self._generate_response_audio(response)
-
-        return True, None
@@ -13,13 +13,15 @@ Multi-user support:
 """
 
 import streamlit as st
+from collections.abc import Iterator
 from typing import Optional
 from datetime import datetime
 
-from services.claude_service import ClaudeService
+from services.claude_service import ClaudeService, recording_reply, relay_reply
 from services.recipe_service import RecipeService, RecipeSummary
 from services.shopping_list_service import ShoppingListService
 from services.audio_service import AudioService
+from controllers.shopping_controller import bump_user_lists_version
 from config.database import SessionLocal
 from config.auth import get_current_user, require_auth
 from models.repositories.user_preferences_repository import UserPreferencesRepository
@@ -39,6 +41,14 @@ class PlanningController:
         self.claude = ClaudeService()
         self.recipes = RecipeService()
         self.audio = AudioService()
+
+    def init_session(self):
+        """
+        Prepare the current user's session state.
+
+        The controller itself holds only service clients and is shared
+        across sessions, so views call this on every run.
+        """
         self._init_session_state()
         self._load_user_preferences()
 
@@ -52,6 +62,8 @@ class PlanningController:
                 "shopping_list_id": None,
                 "audio_key": 0,
                 "pending_audio": None,
+                "pending_prompt": None,  # (message, with_voice) awaiting a reply
+                "plan_updated": False,  # A reply added recipes after the sidebar drew
                 "voice_name": DEFAULT_VOICE_NAME,
                 "voice_rate": DEFAULT_VOICE_RATE,
                 "preferences_loaded": False,
@@ -187,35 +199,63 @@ class PlanningController:
     # Chat Operations
     # ==========================================
 
-    def send_message(self, user_message: str, with_voice: bool = False) -> str:
+    def queue_message(self, user_message: str, with_voice: bool = False):
+        """Queue a message; its reply is streamed by take_pending_reply()."""
+        st.session_state.planning["pending_prompt"] = (user_message, with_voice)
+
+    def take_pending_reply(self) -> Optional[tuple[str, Iterator[str]]]:
         """
-        Send a message to Claude for meal planning.
+        Take the queued message and start Claude's reply to it.
 
-        Args:
-            user_message: The user's message
-            with_voice: If True, generate TTS audio for the response
+        Returns (message, reply chunks), or None if nothing is queued.
+        The exchange is added to history as the chunks are consumed; plan
+        updates and TTS audio are applied once they are done.
+        """
+        pending = st.session_state.planning.get("pending_prompt")
+        if not pending:
+            return None
+        st.session_state.planning["pending_prompt"] = None
+
+        user_message, with_voice = pending
+        return user_message, self._stream_reply(user_message, with_voice)
+
+    def take_plan_updated(self) -> bool:
+        """
+        Check (and clear) whether the last reply added recipes to the plan.
 
-        Returns Claude's response.
+        The reply is recorded after the sidebar has been drawn, so the view
+        reruns when this is set to show the updated plan.
         """
+        updated = st.session_state.planning.get("plan_updated", False)
+        st.session_state.planning["plan_updated"] = False
+        return updated
+
+    def _stream_reply(self, user_message: str, with_voice: bool) -> Iterator[str]:
+        """Stream Claude's planning reply, recording it as it arrives."""
         recipe_list = self.get_recipe_context_for_claude()
-        history = st.session_state.planning["messages"]
+        messages = st.session_state.planning["messages"]
+        history = list(messages)
+
+        with recording_reply(messages, user_message) as reply:
+            response, recipe_ids_to_add = yield from relay_reply(
+                self.claude.stream_planning(user_message, recipe_list, history),
+                reply,
+            )
 
-        # Get Claude's response with potential tool calls
-        response, recipe_ids_to_add = self.claude.chat_planning(user_message, recipe_list, history)
+        self._apply_reply(response, recipe_ids_to_add, with_voice)
 
+    def _apply_reply(
+        self,
+        response: str,
+        recipe_ids_to_add: list[int],
+        with_voice: bool,
+    ):
+        """Apply a finished reply: plan updates and optional TTS."""
         # Add any recipes Claude suggested to the plan
         for recipe_id in recipe_ids_to_add:
             self.add_recipe_to_plan(recipe_id)
-
-        # Update message history
-        st.session_state.planning["messages"].append({
-            "role": "user",
-            "content": user_message
-        })
-        st.session_state.planning["messages"].append({
-            "role": "assistant",
-            "content": response
-        })
+        if recipe_ids_to_add:
+            st.session_state.planning["plan_updated"] = True
 
         # Generate TTS audio if voice mode
         if with_voice and response:
@@ -227,11 +267,9 @@ class PlanningController:
             if audio_bytes:
                 st.session_state.planning["pending_audio"] = audio_bytes
 
-        return response
-
     def handle_voice_input(self, audio_bytes: bytes) -> tuple[bool, Optional[str]]:
         """
-        Process voice input.
+        Process voice input by queueing its transcript for a spoken reply.
 
         Returns (success, error_message)
         """
@@ -239,13 +277,20 @@ class PlanningController:
         if not text:
             return False, "Could not understand audio. Please try again."
 
-        self.send_message(text, with_voice=True)
+        self.queue_message(text, with_voice=True)
         return True, None
 
-    def start_conversation(self) -> str:
-        """Start a new planning conversation with an initial prompt."""
+    def start_conversation(self):
+        """
+        Start a new planning conversation by queueing an initial prompt.
+
+        A message the user already queued (e.g. a quick prompt clicked while
+        the opening reply was streaming) takes its place instead.
+        """
+        if st.session_state.planning.get("pending_prompt"):
+            return
         initial_message = "I'd like to plan some meals."
-        return self.send_message(initial_message)
+        self.queue_message(initial_message)
 
     def clear_conversation(self):
         """Clear the conversation and start fresh."""
@@ -256,6 +301,8 @@ class PlanningController:
             "shopping_list_id": None,
             "audio_key": 0,
             "pending_audio": None,
+            "pending_prompt": None,
+            "plan_updated": False,
             "voice_name": st.session_state.planning.get("voice_name", DEFAULT_VOICE_NAME),
             "voice_rate": st.session_state.planning.get("voice_rate", DEFAULT_VOICE_RATE),
             "preferences_loaded": True,  # Keep loaded state
@@ -321,6 +368,8 @@ class PlanningController:
                 use_claude=use_smart_aggregation
             )
             shopping_list_id = shopping_list.ShoppingListId
+            # The new list must show up in the owner's cached list summaries
+            bump_user_lists_version(user.user_id)
 
             st.session_state.planning["plan_confirmed"] = True
             st.session_state.planning["shopping_list_id"] = shopping_list_id
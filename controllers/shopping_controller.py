@@ -11,14 +11,16 @@ Multi-user support:
 - Shared links allow access to specific lists without ownership
 """
 
+import threading
+
 import streamlit as st
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from config.settings import get_settings
 from config.database import SessionLocal
 from config.auth import get_current_user, require_auth, UserContext
-from models import ShoppingList, ShoppingListItem
+from models import ShoppingList
 from models.repositories import ShoppingListRepository
 from services.notification_service import NotificationService, SMSResult, EmailResult, EmailItemDetail
 from services.grocery_apis import KrogerAPI, PriceResult, ProductMatch
@@ -58,6 +60,76 @@ class PriceComparisonResult:
     error: Optional[str] = None
 
 
+@dataclass
+class _DataVersions:
+    """Write counters shared by all sessions, for keying cached reads."""
+    lists: dict[int, int] = field(default_factory=dict)  # {list_id: n}
+    user_lists: dict[str, int] = field(default_factory=dict)  # {user_id: n}
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@st.cache_resource(show_spinner=False)
+def _data_versions() -> _DataVersions:
+    """The process-wide write counters."""
+    return _DataVersions()
+
+
+def get_list_version(list_id: int) -> int:
+    """
+    Version of a list's contents, for keying cached list reads.
+
+    Cached reads are shared across sessions, so the versions are too: a
+    write from any session (owner or shared-link viewer) moves every
+    session onto a fresh entry for that list, and only that list.
+    """
+    return _data_versions().lists.get(list_id, 0)
+
+
+def bump_list_version(list_id: int):
+    """Invalidate cached reads of a list after a write to it."""
+    versions = _data_versions()
+    with versions.lock:
+        versions.lists[list_id] = versions.lists.get(list_id, 0) + 1
+
+
+def get_user_lists_version(user_id: str) -> int:
+    """Version of a user's list summaries, for keying cached summary reads."""
+    return _data_versions().user_lists.get(user_id, 0)
+
+
+def bump_user_lists_version(user_id: str):
+    """Invalidate a user's cached list summaries after a list write."""
+    versions = _data_versions()
+    with versions.lock:
+        versions.user_lists[user_id] = versions.user_lists.get(user_id, 0) + 1
+
+
+# Configuration checks - settings don't change between reruns, so these are
+# cached rather than rebuilding service clients on every render
+@st.cache_data(ttl=60, show_spinner=False)
+def _sms_configured() -> bool:
+    """Whether SMS sending and the app base URL are configured."""
+    notification = NotificationService()
+    settings = get_settings()
+    has_base_url = bool(settings.app_base_url)
+    return notification.is_configured() and has_base_url
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _email_configured() -> bool:
+    """Whether email sending and the app base URL are configured."""
+    notification = NotificationService()
+    settings = get_settings()
+    has_base_url = bool(settings.app_base_url)
+    return notification.is_email_configured() and has_base_url
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _kroger_configured() -> bool:
+    """Whether Kroger API credentials are configured."""
+    return KrogerAPI().is_configured()
+
+
 class ShoppingController:
     """Controller for shopping list management."""
 
@@ -74,6 +146,7 @@ class ShoppingController:
                 "removed_items": {},  # {list_id: set of item_ids}
                 "selected_products": {},  # {item_id: ProductMatch}
                 "price_results": {},  # {list_id: PriceComparisonResult}
+                "pending_checks": {},  # {list_id: {item_id: is_checked}} not yet saved
             }
 
     # ==========================================
@@ -93,6 +166,30 @@ class ShoppingController:
         """Get the current shareable link code."""
         return st.session_state.shopping["link_code"]
 
+    def get_list_version(self, list_id: int) -> int:
+        """Counter bumped on every write to a list, for keying cached reads."""
+        return get_list_version(list_id)
+
+    def get_lists_version(self, user_id: Optional[str]) -> int:
+        """Counter bumped when a user's list summaries change."""
+        return get_user_lists_version(user_id) if user_id else 0
+
+    def _bump_list_version(self, list_id: int):
+        """Invalidate cached reads of a list after a write to it."""
+        bump_list_version(list_id)
+
+    def _bump_lists_version(self):
+        """
+        Invalidate the current user's cached list summaries.
+
+        Lists are created, deleted and completed by their owner, so the
+        current user is the one whose sidebar changes. Ticks by a shared-link
+        viewer reach the owner's item counts within the cache TTL.
+        """
+        user = get_current_user()
+        if user:
+            bump_user_lists_version(user.user_id)
+
     # ==========================================
     # Removed Items Management
     # ==========================================
@@ -226,14 +323,17 @@ class ShoppingController:
             repo = ShoppingListRepository(db)
             lists = repo.get_all_active(user.user_id)
 
+            # Count items in SQL rather than loading every list's items
+            counts = repo.get_item_counts([sl.ShoppingListId for sl in lists])
+
             summaries = []
             for sl in lists:
-                items = sl.items if sl.items else []
+                item_count, checked_count = counts.get(sl.ShoppingListId, (0, 0))
                 summaries.append(ShoppingListSummary(
                     id=sl.ShoppingListId,
                     name=sl.Name or f"List #{sl.ShoppingListId}",
-                    item_count=len(items),
-                    checked_count=sum(1 for i in items if i.IsChecked),
+                    item_count=item_count,
+                    checked_count=checked_count,
                     recipe_count=len(sl.recipes) if sl.recipes else 0,
                     status=sl.Status,
                 ))
@@ -268,34 +368,56 @@ class ShoppingController:
         finally:
             db.close()
 
-    def get_items_grouped(self, list_id: int) -> dict[str, list[ShoppingListItem]]:
-        """Get shopping list items grouped by category."""
-        db = SessionLocal()
-        try:
-            repo = ShoppingListRepository(db)
-            return repo.get_items_by_category(list_id)
-        finally:
-            db.close()
-
     # ==========================================
     # Item Operations
     # ==========================================
 
-    def toggle_item(self, item_id: int) -> Optional[bool]:
+    def toggle_item(self, list_id: int, item_id: int) -> Optional[bool]:
         """Toggle an item's checked status. Returns new status."""
         db = SessionLocal()
         try:
             repo = ShoppingListRepository(db)
-            return repo.toggle_item(item_id)
+            is_checked = repo.toggle_item(item_id)
+            self._bump_list_version(list_id)
+            self._bump_lists_version()
+            return is_checked
         finally:
             db.close()
 
-    def check_item(self, item_id: int, checked: bool):
+    def check_item(self, list_id: int, item_id: int, checked: bool):
         """Set an item's checked status."""
         db = SessionLocal()
         try:
             repo = ShoppingListRepository(db)
             repo.set_item_checked(item_id, checked)
+            self._bump_list_version(list_id)
+            self._bump_lists_version()
+        finally:
+            db.close()
+
+    def queue_check(self, list_id: int, item_id: int, checked: bool):
+        """Buffer an item's checked status until the next flush_checks()."""
+        pending = st.session_state.shopping.setdefault("pending_checks", {})
+        pending.setdefault(list_id, {})[item_id] = checked
+
+    def flush_checks(self):
+        """Save all buffered checked-status changes in one transaction."""
+        pending = st.session_state.shopping.get("pending_checks")
+        if not pending:
+            return
+        st.session_state.shopping["pending_checks"] = {}
+
+        db = SessionLocal()
+        try:
+            repo = ShoppingListRepository(db)
+            repo.set_items_checked({
+                item_id: checked
+                for checks in pending.values()
+                for item_id, checked in checks.items()
+            })
+            for list_id in pending:
+                self._bump_list_version(list_id)
+            self._bump_lists_version()
         finally:
             db.close()
 
@@ -324,6 +446,7 @@ class ShoppingController:
             else:
                 link = repo.create_link(list_id, expires_days=expires_days)
                 link_code = link.LinkCode
+                self._bump_list_version(list_id)
 
             st.session_state.shopping["link_code"] = link_code
             return link_code
@@ -353,6 +476,8 @@ class ShoppingController:
         try:
             repo = ShoppingListRepository(db)
             success = repo.delete(list_id)
+            self._bump_list_version(list_id)
+            self._bump_lists_version()
             if success and st.session_state.shopping["current_list_id"] == list_id:
                 st.session_state.shopping["current_list_id"] = None
                 st.session_state.shopping["link_code"] = None
@@ -372,7 +497,10 @@ class ShoppingController:
         db = SessionLocal()
         try:
             repo = ShoppingListRepository(db)
-            return repo.update_status(list_id, "completed")
+            updated = repo.update_status(list_id, "completed")
+            self._bump_list_version(list_id)
+            self._bump_lists_version()
+            return updated
         finally:
             db.close()
 
@@ -382,10 +510,7 @@ class ShoppingController:
 
     def is_sms_configured(self) -> bool:
         """Check if SMS is properly configured (including app base URL)."""
-        notification = NotificationService()
-        settings = get_settings()
-        has_base_url = bool(settings.app_base_url)
-        return notification.is_configured() and has_base_url
+        return _sms_configured()
 
     def get_sms_config_issues(self) -> list[str]:
         """Get list of SMS configuration issues."""
@@ -456,10 +581,7 @@ class ShoppingController:
 
     def is_email_configured(self) -> bool:
         """Check if Email is properly configured (including app base URL)."""
-        notification = NotificationService()
-        settings = get_settings()
-        has_base_url = bool(settings.app_base_url)
-        return notification.is_email_configured() and has_base_url
+        return _email_configured()
 
     def get_email_config_issues(self) -> list[str]:
         """Get list of Email configuration issues."""
@@ -516,10 +638,11 @@ class ShoppingController:
         cached_prices = self.get_cached_prices(list_id)
 
         # Build a lookup from item_id to price info
-        price_info_lookup = {}
-        if cached_prices and cached_prices.success:
-            for item_info in cached_prices.items:
-                price_info_lookup[item_info.item_id] = item_info
+        price_info_lookup = (
+            {info.item_id: info for info in cached_prices.items}
+            if cached_prices and cached_prices.success
+            else {}
+        )
 
         for item in shopping_list.items:
             # Skip removed items
@@ -573,8 +696,7 @@ class ShoppingController:
 
     def is_kroger_configured(self) -> bool:
         """Check if Kroger API is properly configured."""
-        kroger = KrogerAPI()
-        return kroger.is_configured()
+        return _kroger_configured()
 
     def get_kroger_config_issues(self) -> list[str]:
         """Get list of Kroger configuration issues."""
@@ -175,7 +175,8 @@ class ShoppingList(Base):
     items = relationship(
         "ShoppingListItem",
         back_populates="shopping_list",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="(ShoppingListItem.SortOrder, ShoppingListItem.ShoppingListItemId)"
     )
     links = relationship(
         "ShoppingListLink",
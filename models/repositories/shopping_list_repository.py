@@ -9,7 +9,8 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, selectinload
 
 from models.entities import (
     ShoppingList,
@@ -51,11 +52,16 @@ class ShoppingListRepository:
         return shopping_list
 
     def get_by_id(self, shopping_list_id: int) -> Optional[ShoppingList]:
-        """Get a shopping list by ID with all relationships loaded."""
+        """
+        Get a shopping list by ID with all relationships loaded.
+
+        Collections use selectinload (one extra query each) rather than
+        joining them all, which would multiply recipes x items x links rows.
+        """
         return self.db.query(ShoppingList).options(
-            joinedload(ShoppingList.recipes).joinedload(ShoppingListRecipe.recipe),
-            joinedload(ShoppingList.items).joinedload(ShoppingListItem.ingredient),
-            joinedload(ShoppingList.links)
+            selectinload(ShoppingList.recipes).joinedload(ShoppingListRecipe.recipe),
+            selectinload(ShoppingList.items).joinedload(ShoppingListItem.ingredient),
+            selectinload(ShoppingList.links)
         ).filter(ShoppingList.ShoppingListId == shopping_list_id).first()
 
     def get_by_link_code(self, link_code: str) -> Optional[ShoppingList]:
@@ -77,11 +83,45 @@ class ShoppingListRepository:
         Args:
             user_id: The Entra ID object ID of the user
         """
-        return self.db.query(ShoppingList).filter(
+        return self.db.query(ShoppingList).options(
+            selectinload(ShoppingList.recipes)  # For recipe counts, in one query
+        ).filter(
             ShoppingList.UserId == user_id,
             ShoppingList.Status == 'active'
         ).order_by(ShoppingList.CreatedDate.desc()).all()
 
+    def get_item_counts(
+        self,
+        shopping_list_ids: list[int]
+    ) -> dict[int, tuple[int, int]]:
+        """
+        Get item totals for several shopping lists in one query.
+
+        Args:
+            shopping_list_ids: The shopping list IDs to count
+
+        Returns:
+            Dict of {shopping_list_id: (item_count, checked_count)}; lists
+            without items are omitted
+        """
+        if not shopping_list_ids:
+            return {}
+
+        rows = self.db.query(
+            ShoppingListItem.ShoppingListId,
+            func.count(ShoppingListItem.ShoppingListItemId),
+            func.sum(case((ShoppingListItem.IsChecked == True, 1), else_=0)),  # noqa: E712
+        ).filter(
+            ShoppingListItem.ShoppingListId.in_(shopping_list_ids)
+        ).group_by(
+            ShoppingListItem.ShoppingListId
+        ).all()
+
+        return {
+            list_id: (item_count, int(checked_count or 0))
+            for list_id, item_count, checked_count in rows
+        }
+
     def update_status(self, shopping_list_id: int, status: str) -> bool:
         """Update the status of a shopping list."""
         result = self.db.query(ShoppingList).filter(
@@ -221,6 +261,26 @@ class ShoppingListRepository:
         self.db.commit()
         return result > 0
 
+    def set_items_checked(self, checks: dict[int, bool]) -> int:
+        """
+        Set the checked status of several items in one transaction.
+
+        Args:
+            checks: Dict of {item_id: is_checked}
+
+        Returns:
+            Number of items updated
+        """
+        updated = 0
+        for is_checked in (True, False):
+            item_ids = [item_id for item_id, value in checks.items() if value == is_checked]
+            if item_ids:
+                updated += self.db.query(ShoppingListItem).filter(
+                    ShoppingListItem.ShoppingListItemId.in_(item_ids)
+                ).update({"IsChecked": is_checked}, synchronize_session=False)
+        self.db.commit()
+        return updated
+
     def clear_items(self, shopping_list_id: int) -> int:
         """Remove all items from a shopping list. Returns count deleted."""
         result = self.db.query(ShoppingListItem).filter(
@@ -317,26 +377,3 @@ class ShoppingListRepository:
             ShoppingList.UserId == user_id
         ).first()
         return result is not None
-
-    def get_items_by_category(
-        self,
-        shopping_list_id: int
-    ) -> dict[str, list[ShoppingListItem]]:
-        """Get shopping list items grouped by category."""
-        items = self.db.query(ShoppingListItem).options(
-            joinedload(ShoppingListItem.ingredient)
-        ).filter(
-            ShoppingListItem.ShoppingListId == shopping_list_id
-        ).order_by(
-            ShoppingListItem.Category,
-            ShoppingListItem.SortOrder
-        ).all()
-
-        grouped = {}
-        for item in items:
-            category = item.Category or "Other"
-            if category not in grouped:
-                grouped[category] = []
-            grouped[category].append(item)
-
-        return grouped
@@ -85,10 +85,12 @@ class AudioService:
         """
         try:
             communicate = edge_tts.Communicate(text, voice, rate=rate)
-            audio_bytes = b""
+            # Collect chunks and join once - repeated bytes += is quadratic
+            chunks = []
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    audio_bytes += chunk["data"]
+                    chunks.append(chunk["data"])
+            audio_bytes = b"".join(chunks)
             return audio_bytes if audio_bytes else None
         except Exception as e:
             logger.error(f"Edge-TTS error: {e}")
@@ -5,9 +5,60 @@ This service is pure Python with no Streamlit dependencies,
 making it easy to test and reuse across different contexts.
 """
 
+from collections.abc import Generator, Iterator
+from contextlib import closing, contextmanager
+from typing import TypeVar
+
 import anthropic
 from config.settings import get_settings
 
+T = TypeVar("T")
+
+
+@contextmanager
+def recording_reply(messages: list[dict], text: str) -> Iterator[dict]:
+    """
+    Add a user message and an assistant reply to be filled in as it streams.
+
+    The exchange is in history before the first chunk, so a stream that is
+    interrupted doesn't lose it. A reply that never got any text is dropped,
+    as the API rejects empty messages.
+
+    Yields:
+        The assistant message dict, for relay_reply() to fill
+    """
+    messages.append({"role": "user", "content": text})
+    reply = {"role": "assistant", "content": ""}
+    messages.append(reply)
+    try:
+        yield reply
+    finally:
+        if not reply["content"] and messages and messages[-1] is reply:
+            messages.pop()
+
+
+def relay_reply(
+    stream: Generator[str, None, T],
+    message: dict,
+) -> Generator[str, None, T]:
+    """
+    Relay a stream_* generator, appending each chunk to message["content"].
+
+    Used with recording_reply(), so a stream that is abandoned part way
+    still leaves the text received so far in history.
+
+    Returns:
+        The wrapped stream's result
+    """
+    with closing(stream):
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as done:
+                return done.value
+            message["content"] += chunk
+            yield chunk
+
 
 class ClaudeService:
     """Service for interacting with Claude API."""
@@ -155,102 +206,148 @@ Keep responses SHORT (1-3 sentences) unless they ask for detail.
 
         return response.content[0].text
 
-    def chat_discovery(
+    def get_discovery_greeting(self, recipe_list: str) -> str:
+        """
+        Get an initial greeting for the discovery chat.
+
+        Args:
+            recipe_list: Formatted list of available recipes
+
+        Returns:
+            Greeting message from Claude
+        """
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=300,
+            system=self.DISCOVERY_SYSTEM_PROMPT.format(recipe_list=recipe_list),
+            messages=[{
+                "role": "user",
+                "content": "Hi, I want to cook something!"
+            }]
+        )
+
+        return response.content[0].text
+
+    # ==========================================
+    # Streaming
+    # ==========================================
+    # These yield text deltas as they arrive and *return* the full reply (and
+    # any tool call result), so callers can `result = yield from ...`.
+
+    def stream_cooking(
         self,
         message: str,
-        recipe_list: str,
+        recipe_context: str,
         history: list[dict]
-    ) -> tuple[str, int | None]:
+    ) -> Generator[str, None, str]:
         """
-        Send a message in recipe discovery context with tool calling.
+        Stream a reply in cooking context.
 
         Args:
             message: User's message
-            recipe_list: Formatted list of available recipes
+            recipe_context: Formatted recipe text
             history: List of previous messages
 
+        Yields:
+            Response text chunks
+
         Returns:
-            Tuple of (response_text, selected_recipe_id or None)
+            Claude's full response text
         """
         messages = history + [{"role": "user", "content": message}]
 
-        response = self.client.messages.create(
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=500,
-            system=self.DISCOVERY_SYSTEM_PROMPT.format(recipe_list=recipe_list),
-            messages=messages,
-            tools=self.DISCOVERY_TOOLS
-        )
-
-        # Extract text response and tool calls
-        response_text = ""
-        selected_recipe_id = None
-
-        for block in response.content:
-            if block.type == "text":
-                response_text = block.text
-            elif block.type == "tool_use" and block.name == "select_recipe":
-                selected_recipe_id = block.input.get("recipe_id")
+            system=self.COOKING_SYSTEM_PROMPT.format(recipe_context=recipe_context),
+            messages=messages
+        ) as stream:
+            yield from stream.text_stream
+            response = stream.get_final_message()
 
-        return response_text, selected_recipe_id
+        return self._response_text(response)
 
-    def get_discovery_greeting(self, recipe_list: str) -> str:
+    def stream_discovery(
+        self,
+        message: str,
+        recipe_list: str,
+        history: list[dict]
+    ) -> Generator[str, None, tuple[str, int | None]]:
         """
-        Get an initial greeting for the discovery chat.
+        Stream a reply in recipe discovery context with tool calling.
 
         Args:
+            message: User's message
             recipe_list: Formatted list of available recipes
+            history: List of previous messages
+
+        Yields:
+            Response text chunks
 
         Returns:
-            Greeting message from Claude
+            Tuple of (response_text, selected_recipe_id or None)
         """
-        response = self.client.messages.create(
+        messages = history + [{"role": "user", "content": message}]
+
+        with self.client.messages.stream(
             model=self.model,
-            max_tokens=300,
+            max_tokens=500,
             system=self.DISCOVERY_SYSTEM_PROMPT.format(recipe_list=recipe_list),
-            messages=[{
-                "role": "user",
-                "content": "Hi, I want to cook something!"
-            }]
-        )
+            messages=messages,
+            tools=self.DISCOVERY_TOOLS
+        ) as stream:
+            yield from stream.text_stream
+            response = stream.get_final_message()
 
-        return response.content[0].text
+        tool_input = self._tool_input(response, "select_recipe")
+        return self._response_text(response), tool_input.get("recipe_id")
 
-    def chat_planning(
+    def stream_planning(
         self,
         message: str,
         recipe_list: str,
         history: list[dict]
-    ) -> tuple[str, list[int]]:
+    ) -> Generator[str, None, tuple[str, list[int]]]:
         """
-        Send a message in meal planning context with tool calling.
+        Stream a reply in meal planning context with tool calling.
 
         Args:
             message: User's message
             recipe_list: Formatted list of available recipes
             history: List of previous messages
 
+        Yields:
+            Response text chunks
+
         Returns:
             Tuple of (response_text, list of recipe_ids to add)
         """
         messages = history + [{"role": "user", "content": message}]
 
-        response = self.client.messages.create(
+        with self.client.messages.stream(
             model=self.model,
             max_tokens=1000,
             system=self.PLANNING_SYSTEM_PROMPT.format(recipe_list=recipe_list),
             messages=messages,
             tools=self.PLANNING_TOOLS
+        ) as stream:
+            yield from stream.text_stream
+            response = stream.get_final_message()
+
+        tool_input = self._tool_input(response, "add_recipes_to_plan")
+        return self._response_text(response), tool_input.get("recipe_ids", [])
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """All text in a response, i.e. exactly what was streamed."""
+        return "".join(
+            block.text for block in response.content if block.type == "text"
         )
 
-        # Extract text response and tool calls
-        response_text = ""
-        recipe_ids_to_add = []
-
+    @staticmethod
+    def _tool_input(response, tool_name: str) -> dict:
+        """Input of the named tool call in a response, or {} if not called."""
         for block in response.content:
-            if block.type == "text":
-                response_text = block.text
-            elif block.type == "tool_use" and block.name == "add_recipes_to_plan":
-                recipe_ids_to_add = block.input.get("recipe_ids", [])
-
-        return response_text, recipe_ids_to_add
+            if block.type == "tool_use" and block.name == tool_name:
+                return block.input
+        return {}
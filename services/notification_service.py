@@ -17,6 +17,10 @@ from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Validation patterns, compiled once at import
+PHONE_STRIP_RE = re.compile(r'[^\d+]')  # Everything except digits and +
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 @dataclass
 class SMSResult:
@@ -99,7 +103,7 @@ class NotificationService:
         Returns (is_valid, normalized_number_or_error)
         """
         # Remove all non-digit characters except leading +
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = PHONE_STRIP_RE.sub('', phone)
 
         # Handle various formats
         if cleaned.startswith('+1'):
@@ -266,8 +270,7 @@ class NotificationService:
         """Validate an email address. Returns (is_valid, email_or_error)."""
         email = email.strip().lower()
         # Simple email validation
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(pattern, email):
+        if EMAIL_RE.match(email):
             return True, email
         return False, "Please enter a valid email address"
 
@@ -3,8 +3,8 @@ Reusable UI components.
 """
 
 from views.components.chat import render_chat_messages
-from views.components.audio import render_mic_button, render_audio_playback
-from views.components.shopping_item import render_shopping_item, render_shopping_items_grouped
+from views.components.voice_panel import render_voice_panel, render_voice_controls
+from views.components.shopping_item import render_shopping_items_grouped
 from views.components.shopping_stats import render_shopping_stats
 
 # Sidebar components
@@ -21,12 +21,11 @@ from views.components.share import (
 )
 
 __all__ = [
-    # Chat & Audio
+    # Chat & Voice
     "render_chat_messages",
-    "render_mic_button",
-    "render_audio_playback",
+    "render_voice_panel",
+    "render_voice_controls",
     # Shopping
-    "render_shopping_item",
     "render_shopping_items_grouped",
     "render_shopping_stats",
     # Sidebar
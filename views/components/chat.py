@@ -3,19 +3,51 @@ Chat UI components.
 """
 
 import streamlit as st
+from collections.abc import Iterator
+from typing import Optional
 
+# Messages rendered as individual chat bubbles; older ones are collapsed
+RECENT_MESSAGE_LIMIT = 20
 
-def render_chat_messages(messages: list[dict], height: int = 450):
+ROLE_LABELS = {"user": "You", "assistant": "Assistant"}
+
+
+def render_chat_messages(
+    messages: list[dict],
+    height: int = 450,
+    reply: Optional[tuple[str, Iterator[str]]] = None,
+):
     """
     Render chat message history in a scrollable container.
 
     Args:
-        messages: List of {"role": "user/assistant", "content": "..."}
+        messages: List of {"role": "user/assistant", "content": "..."}.
+            Only the last RECENT_MESSAGE_LIMIT get their own chat bubble;
+            earlier ones are shown as one block in a collapsed expander.
         height: Container height in pixels
+        reply: Optional (user message, reply chunks) to stream in below
+            the history as the chunks arrive
     """
     st.markdown("### Conversation")
     chat_container = st.container(height=height)
     with chat_container:
-        for msg in messages:
+        older = messages[:-RECENT_MESSAGE_LIMIT]
+        recent = messages[-RECENT_MESSAGE_LIMIT:]
+
+        if older:
+            with st.expander(f"Show earlier messages ({len(older)})"):
+                st.markdown("\n\n".join(
+                    f"**{ROLE_LABELS.get(msg['role'], msg['role'])}:** {msg['content']}"
+                    for msg in older
+                ))
+
+        for msg in recent:
             with st.chat_message(msg["role"]):
                 st.write(msg["content"])
+
+        if reply:
+            user_message, chunks = reply
+            with st.chat_message("user"):
+                st.write(user_message)
+            with st.chat_message("assistant"):
+                st.write_stream(chunks)
@@ -37,51 +37,36 @@ AZURE_COMM_EMAIL_SENDER=DoNotReply@<guid>.azurecomm.net
 APP_BASE_URL=https://your-app.azurecontainerapps.io""")
         return
 
-    # Initialize session state for email
-    if "share_email" not in st.session_state:
-        st.session_state.share_email = ""
-    if "email_sent" not in st.session_state:
-        st.session_state.email_sent = False
-    if "email_error" not in st.session_state:
-        st.session_state.email_error = None
+    # Address and send button submit together as one form - typing alone
+    # triggers no rerun, and the form keeps the address between runs
+    with st.form("email_share_form", border=False):
+        email = st.text_input(
+            "Email address:",
+            placeholder="you@example.com",
+            help="Enter an email address"
+        )
+        submitted = st.form_submit_button(
+            "Send to Email", type="primary", use_container_width=True
+        )
 
-    # Email input
-    email = st.text_input(
-        "Email address:",
-        value=st.session_state.share_email,
-        placeholder="you@example.com",
-        help="Enter an email address"
-    )
-    st.session_state.share_email = email
+    if not submitted:
+        return
 
-    # Send button
-    if st.button("Send to Email", type="primary", use_container_width=True):
-        if not email:
-            st.session_state.email_error = "Please enter an email address"
-        else:
-            # Validate email
-            is_valid, message = validate_email(email)
-            if not is_valid:
-                st.session_state.email_error = message
-            else:
-                # Send email
-                with st.spinner("Sending..."):
-                    result = send_email(list_id, email)
+    if not email:
+        st.error("Please enter an email address")
+        return
 
-                if result.success:
-                    st.session_state.email_sent = True
-                    st.session_state.email_error = None
-                else:
-                    st.session_state.email_error = result.error
-                    st.session_state.email_sent = False
+    # Validate email
+    is_valid, message = validate_email(email)
+    if not is_valid:
+        st.error(message)
+        return
 
-        st.rerun()
+    # Send email
+    with st.spinner("Sending..."):
+        result = send_email(list_id, email)
 
-    # Show status
-    if st.session_state.email_sent:
+    if result.success:
         st.success("Shopping list sent! Check your email.")
-        st.session_state.email_sent = False
-
-    if st.session_state.email_error:
-        st.error(st.session_state.email_error)
-        st.session_state.email_error = None
+    else:
+        st.error(result.error)
@@ -13,7 +13,7 @@ def render_link_share(
     get_shareable_url: Callable[[str], str],
 ):
     """
-    Render the shareable link section.
+    Render the shareable link section (call from inside an st.fragment).
 
     Args:
         list_id: Shopping list ID to share
@@ -22,9 +22,9 @@ def render_link_share(
         get_shareable_url: Function to build full URL from link code
     """
     if st.button("Generate Link", use_container_width=True):
-        link_code = generate_link(list_id)
-        st.session_state.shopping["link_code"] = link_code
-        st.rerun()
+        # generate_link stores the code, which get_link_code reads below
+        generate_link(list_id)
+        st.rerun(scope="fragment")
 
     link_code = get_link_code()
     if link_code:
@@ -54,16 +54,18 @@ def render_shopping_item_row(
         [0.5, 2.5, 1.5, 3, 1, 0.5]
     )
 
+    # Widgets report changes through callbacks, which run before the rerun
+    # they trigger - so the rerun stays scoped to the enclosing fragment
     with col_check:
-        checked = st.checkbox(
+        check_key = f"check_{item_id}"
+        st.checkbox(
             "checked",
             value=item.IsChecked,
-            key=f"check_{item_id}",
-            label_visibility="collapsed"
+            key=check_key,
+            label_visibility="collapsed",
+            on_change=_on_widget_change,
+            args=(check_key, item_id, on_check_change),
         )
-        if checked != item.IsChecked:
-            on_check_change(item_id, checked)
-            st.rerun()
 
     with col_item:
         if item.IsChecked:
@@ -95,19 +97,17 @@ def render_shopping_item_row(
                             current_idx = idx
                             break
 
-                selected_idx = st.selectbox(
+                product_key = f"product_{item_id}"
+                st.selectbox(
                     "Product",
                     range(len(options)),
                     index=current_idx,
                     format_func=lambda i: option_labels[i],
-                    key=f"product_{item_id}",
-                    label_visibility="collapsed"
+                    key=product_key,
+                    label_visibility="collapsed",
+                    on_change=_on_product_change,
+                    args=(product_key, item_id, options, on_product_select),
                 )
-
-                # Handle selection change
-                if selected_idx != current_idx:
-                    on_product_select(item_id, options[selected_idx])
-                    st.rerun()
             else:
                 st.caption(price_info.error or "No match")
         else:
@@ -123,9 +123,28 @@ def render_shopping_item_row(
             st.markdown("--")
 
     with col_remove:
-        if st.button("🗑️", key=f"remove_{item_id}", help="Already have this"):
-            on_remove(item_id)
-            st.rerun()
+        st.button(
+            "🗑️",
+            key=f"remove_{item_id}",
+            help="Already have this",
+            on_click=on_remove,
+            args=(item_id,),
+        )
+
+
+def _on_widget_change(key: str, item_id: int, callback: Callable[[int, Any], None]):
+    """Forward a widget's new value for an item to its callback."""
+    callback(item_id, st.session_state[key])
+
+
+def _on_product_change(
+    key: str,
+    item_id: int,
+    options: list[Any],
+    on_product_select: Callable[[int, Any], None],
+):
+    """Forward the newly selected product for an item."""
+    on_product_select(item_id, options[st.session_state[key]])
 
 
 def render_removed_item_row(
@@ -146,9 +165,13 @@ def render_removed_item_row(
     col_restore, col_item, col_qty, col_spacer = st.columns([0.5, 2.5, 1.5, 5.5])
 
     with col_restore:
-        if st.button("↩️", key=f"restore_{item_id}", help="Add back to list"):
-            on_restore(item_id)
-            st.rerun()
+        st.button(
+            "↩️",
+            key=f"restore_{item_id}",
+            help="Add back to list",
+            on_click=on_restore,
+            args=(item_id,),
+        )
 
     with col_item:
         st.markdown(f"*{ingredient_name}*", help="Removed - click ↩️ to restore")
@@ -250,48 +273,13 @@ def render_removed_section(
             render_removed_item_row(item, on_restore)
 
 
-# Legacy function for backwards compatibility
-def render_shopping_item(
-    item: Any,
-    on_check_change: Callable[[int, bool], None],
-):
-    """
-    Render a single shopping list item with checkbox (legacy).
-
-    Args:
-        item: Shopping list item
-        on_check_change: Callback when checked state changes
-    """
-    col1, col2 = st.columns([1, 5])
-
-    with col1:
-        checked = st.checkbox(
-            "checked",
-            value=item.IsChecked,
-            key=f"item_{item.ShoppingListItemId}",
-            label_visibility="collapsed"
-        )
-
-        if checked != item.IsChecked:
-            on_check_change(item.ShoppingListItemId, checked)
-            st.rerun()
-
-    with col2:
-        ingredient_name = item.ingredient.Name if item.ingredient else "Unknown"
-        quantity = item.AggregatedQuantity or ""
-
-        if item.IsChecked:
-            st.markdown(f"~~{ingredient_name}~~ {quantity}")
-        else:
-            st.markdown(f"**{ingredient_name}** {quantity}")
-
-
+# Simple checklist (no pricing), used for shared lists
 def render_shopping_items_grouped(
     grouped_items: dict[str, list[Any]],
     on_check_change: Callable[[int, bool], None],
 ):
     """
-    Render shopping items grouped by category (legacy).
+    Render shopping items grouped by category, one editable table each.
 
     Args:
         grouped_items: Dict mapping category names to lists of items
@@ -301,10 +289,43 @@ def render_shopping_items_grouped(
         st.info("No items in this list")
         return
 
+    # Only the shared-list tables need pandas; importing it here keeps it
+    # off the import path of every page that loads views.components
+    import pandas as pd
+
     for category, items in grouped_items.items():
         st.markdown(f"#### {category}")
 
+        # One pass over the ORM items, reading each attribute once
+        item_ids = []
+        rows = []
         for item in items:
-            render_shopping_item(item, on_check_change)
+            item_ids.append(item.ShoppingListItemId)
+            rows.append((
+                item.IsChecked,
+                item.ingredient.Name if item.ingredient else "Unknown",
+                item.AggregatedQuantity or "",
+            ))
+
+        key = f"items_{category}"
+        st.data_editor(
+            pd.DataFrame(rows, columns=["Got", "Item", "Qty"]),
+            key=key,
+            hide_index=True,
+            use_container_width=True,
+            disabled=["Item", "Qty"],
+            column_config={"Got": st.column_config.CheckboxColumn("✓", width="small")},
+            on_change=_on_table_edit,
+            args=(key, item_ids, on_check_change),
+        )
+
 
-        st.markdown("")
+def _on_table_edit(
+    key: str,
+    item_ids: list[int],
+    on_check_change: Callable[[int, bool], None],
+):
+    """Forward checkbox edits from a category table, by row."""
+    for row, changes in st.session_state[key]["edited_rows"].items():
+        if "Got" in changes:
+            on_check_change(item_ids[row], changes["Got"])
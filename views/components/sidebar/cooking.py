@@ -8,7 +8,7 @@ from typing import Callable
 
 def render_cooking_sidebar(
     recipe_name: str,
-    on_text_submit: Callable[[str], tuple[bool, str | None]],
+    on_text_submit: Callable[[str], None],
     on_end_session: Callable[[], None],
 ):
     """
@@ -16,33 +16,28 @@ def render_cooking_sidebar(
 
     Args:
         recipe_name: Name of the current recipe
-        on_text_submit: Callback when text is submitted, returns (success, error)
+        on_text_submit: Callback that queues submitted text for a reply
         on_end_session: Callback when session ends
     """
     with st.sidebar:
         st.markdown(f"### {recipe_name}")
-        st.markdown("---")
+        st.divider()
 
         # Text Input (fallback)
         st.markdown("**Text Input**")
-        text_input = st.text_input(
-            "Type your message:",
-            key="text_input",
-            placeholder="What's next?",
-            label_visibility="collapsed"
+        # chat_input clears itself on submit; the chat is rendered after the
+        # sidebar and streams the queued reply on this same run
+        text_input = st.chat_input("What's next?", key="text_input")
+        if text_input:
+            on_text_submit(text_input)
+
+        st.divider()
+
+        # End session button - on_click runs before the rerun it triggers
+        st.button(
+            "End Cooking Session",
+            type="secondary",
+            use_container_width=True,
+            on_click=on_end_session,
         )
 
-        # Handle text input
-        if text_input:
-            success, error = on_text_submit(text_input)
-            if not success:
-                st.error(error)
-            else:
-                st.rerun()
-
-        st.markdown("---")
-
-        # End session button
-        if st.button("End Cooking Session", type="secondary", use_container_width=True):
-            on_end_session()
-            st.rerun()
@@ -6,9 +6,15 @@ import streamlit as st
 from typing import Callable, Any
 
 
+def _format_recipe_option(name: str) -> str:
+    """Selectbox label for a recipe option ("" is the placeholder)."""
+    return name or "Select..."
+
+
 def render_planning_sidebar(
     selected_recipes: list[Any],
-    all_recipes: list[Any],
+    recipe_options: list[str],
+    recipe_ids: dict[str, int],
     is_confirmed: bool,
     shopping_list_id: int | None,
     on_remove_recipe: Callable[[int], None],
@@ -21,7 +27,8 @@ def render_planning_sidebar(
 
     Args:
         selected_recipes: List of selected recipe objects (need .id, .name)
-        all_recipes: List of all available recipes
+        recipe_options: Quick Add options (recipe names, led by a "" placeholder)
+        recipe_ids: Map of recipe name to recipe ID
         is_confirmed: Whether the plan is confirmed
         shopping_list_id: ID of created shopping list (if confirmed)
         on_remove_recipe: Callback to remove a recipe by ID
@@ -31,20 +38,28 @@ def render_planning_sidebar(
     """
     with st.sidebar:
         st.markdown("### Your Plan")
-        st.markdown("---")
+        st.divider()
 
         # Show selected recipes
         if selected_recipes:
-            for recipe in selected_recipes:
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    st.write(f"* {recipe.name}")
-                with col2:
-                    if st.button("x", key=f"remove_{recipe.id}", help="Remove"):
-                        on_remove_recipe(recipe.id)
-                        st.rerun()
+            # Single widget for the whole plan - clear a chip to remove a recipe
+            recipe_names = {r.id: r.name for r in selected_recipes}
+            kept_ids = st.multiselect(
+                "Selected recipes:",
+                options=list(recipe_names),
+                default=list(recipe_names),
+                format_func=recipe_names.get,
+                label_visibility="collapsed",
+                help="Remove a recipe by clearing it",
+            )
+
+            removed_ids = [rid for rid in recipe_names if rid not in kept_ids]
+            if removed_ids:
+                for recipe_id in removed_ids:
+                    on_remove_recipe(recipe_id)
+                st.rerun()
 
-            st.markdown("---")
+            st.divider()
 
             # Confirm plan button
             if not is_confirmed:
@@ -73,25 +88,24 @@ def render_planning_sidebar(
             st.markdown("*No recipes selected yet.*")
             st.markdown("Chat with me to get meal suggestions!")
 
-        st.markdown("---")
+        st.divider()
 
         # Quick add section
         st.markdown("### Quick Add")
-        if all_recipes:
-            recipe_names = {r.name: r.id for r in all_recipes}
+        if recipe_ids:
             selected_name = st.selectbox(
                 "Add a recipe:",
-                options=[""] + list(recipe_names.keys()),
-                format_func=lambda x: "Select..." if x == "" else x,
+                options=recipe_options,
+                format_func=_format_recipe_option,
                 label_visibility="collapsed"
             )
 
             if selected_name:
                 if st.button("Add to Plan", use_container_width=True):
-                    on_add_recipe(recipe_names[selected_name])
+                    on_add_recipe(recipe_ids[selected_name])
                     st.rerun()
 
-        st.markdown("---")
+        st.divider()
 
         # Clear conversation
         if st.button("Clear Conversation", use_container_width=True):
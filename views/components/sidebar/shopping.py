@@ -2,10 +2,21 @@
 Shopping list sidebar component.
 """
 
+import html
+
 import streamlit as st
 from typing import Callable, Any
 
 
+# Styling for the batched progress bars (one markdown block per render)
+PROGRESS_STYLE = """
+<style>
+    .list-progress { margin-bottom: 0.5rem; font-size: 0.85rem; }
+    .list-progress progress { width: 100%; height: 0.5rem; }
+</style>
+"""
+
+
 def render_shopping_list_sidebar(
     lists: list[Any],
     on_select: Callable[[int], None],
@@ -21,22 +32,39 @@ def render_shopping_list_sidebar(
     """
     with st.sidebar:
         st.markdown("### Your Lists")
-        st.markdown("---")
-
-        for lst in lists:
-            progress = lst.checked_count / lst.item_count if lst.item_count > 0 else 0
-            label = f"{lst.name} ({lst.checked_count}/{lst.item_count})"
-
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                if st.button(label, key=f"select_{lst.id}", use_container_width=True):
-                    on_select(lst.id)
-                    st.rerun()
-            with col2:
-                if st.button("x", key=f"delete_{lst.id}", help="Delete list"):
-                    on_delete(lst.id)
-                    st.rerun()
-
-            # Progress bar
-            st.progress(progress)
-            st.markdown("")
+        st.divider()
+
+        # Precompute display values so the loops below only emit widgets
+        labels = [f"{lst.name} ({lst.checked_count}/{lst.item_count})" for lst in lists]
+        progresses = [
+            lst.checked_count / lst.item_count if lst.item_count > 0 else 0.0
+            for lst in lists
+        ]
+
+        # A column pair per list keeps each delete button level with its list
+        # even when a long label wraps. Callbacks run before the rerun a
+        # click triggers, so each click costs one run
+        for i, lst in enumerate(lists):
+            select_col, delete_col = st.columns([4, 1])
+            select_col.button(
+                labels[i],
+                key=f"select_{lst.id}",
+                use_container_width=True,
+                on_click=on_select,
+                args=(lst.id,),
+            )
+            delete_col.button(
+                "x",
+                key=f"delete_{lst.id}",
+                help="Delete list",
+                on_click=on_delete,
+                args=(lst.id,),
+            )
+
+        # Progress bars - emitted as one HTML block instead of one widget per list
+        bars = "".join(
+            f'<div class="list-progress">{html.escape(lst.name)}'
+            f'<progress value="{progresses[i]:.3f}" max="1"></progress></div>'
+            for i, lst in enumerate(lists)
+        )
+        st.markdown(PROGRESS_STYLE + bars, unsafe_allow_html=True)
@@ -10,27 +10,54 @@ different views (Cooking, Planning) with:
 """
 
 import streamlit as st
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Any, Optional, Callable, Mapping
 
 from models.user_preferences import VOICE_OPTIONS, SPEED_OPTIONS
 
 
-# Speed labels for the slider
-SPEED_LABELS = {
-    -2: "Slower",
-    -1: "Slow",
-    0: "Normal",
-    1: "Fast",
-    2: "Faster",
-    3: "Quick",
-    4: "Rapid",
-}
+# Voice column sized to match the 450px chat container. Streamlit adds an
+# st-key-<key> class to keyed containers, so plain CSS does the scrolling.
+VOICE_CONTROLS_KEY = "voice_controls"
+VOICE_CONTROLS_STYLE = f"""
+<style>
+    .st-key-{VOICE_CONTROLS_KEY} {{
+        height: 450px;
+        overflow-y: auto;
+    }}
+</style>
+"""
+
+# Speed labels for the slider, indexed by slider value + 2 (range -2 to +4)
+SPEED_LABELS = ("Slower", "Slow", "Normal", "Fast", "Faster", "Quick", "Rapid")
+
+
+def _speed_label(speed: int) -> str:
+    """Get the display label for a speed slider value."""
+    return SPEED_LABELS[speed + 2] if -2 <= speed <= 4 else "Normal"
+
+
+@lru_cache(maxsize=4)
+def _voices_arrays(
+    voices_items: tuple[tuple[str, str], ...],
+) -> tuple[tuple[str, ...], tuple[str, ...], dict[str, int], dict[str, int]]:
+    """
+    Build the selectbox lookup tables for a voice catalog.
+
+    Returns:
+        (voice_ids, voice_names, id_to_idx, name_to_idx)
+    """
+    voice_ids = tuple(voice_id for voice_id, _ in voices_items)
+    voice_names = tuple(name for _, name in voices_items)
+    id_to_idx = {voice_id: i for i, voice_id in enumerate(voice_ids)}
+    name_to_idx = {name: i for i, name in enumerate(voice_names)}
+    return voice_ids, voice_names, id_to_idx, name_to_idx
 
 
 def render_voice_panel(
     audio_key: int,
     pending_audio: Optional[bytes],
-    voices: dict[str, str],
+    voices: Mapping[str, str],
     current_voice: str,
     current_speed: int,
     on_voice_change: Callable[[str], None],
@@ -41,7 +68,9 @@ def render_voice_panel(
 
     Args:
         audio_key: Unique key for the audio input widget
-        pending_audio: Audio bytes to play (if any)
+        pending_audio: Audio bytes to play (if any). Callers pass a one-shot
+            clip (controllers clear it on read), so the player is emitted
+            once per response and not re-sent on later reruns.
         voices: Dict of {voice_id: display_name}
         current_voice: Currently selected voice ID
         current_speed: Current speed slider value (-2 to +4)
@@ -77,47 +106,186 @@ def render_voice_panel(
         label_visibility="collapsed"
     )
 
+    # Read each recording once rather than on every rerun
     recorded_bytes = None
     if audio:
-        recorded_bytes = audio.read()
+        cached_id, cached_bytes = st.session_state.get("_voice_panel_recording", (None, None))
+        if cached_id != audio.file_id:
+            cached_bytes = audio.getvalue()
+            st.session_state["_voice_panel_recording"] = (audio.file_id, cached_bytes)
+        recorded_bytes = cached_bytes
 
-    # Audio playback section
+    # Audio playback section - only present on the run that delivers a new clip
     if pending_audio:
         st.markdown("**Response**")
         st.audio(pending_audio, format="audio/mp3", autoplay=True)
 
-    st.markdown("---")
+    st.divider()
+
+    _render_voice_settings(
+        voices=voices,
+        current_voice=current_voice,
+        current_speed=current_speed,
+        on_voice_change=on_voice_change,
+        on_speed_change=on_speed_change,
+    )
+
+    return recorded_bytes
+
+
+def render_voice_controls(
+    *,
+    key_prefix: str,
+    audio_key: int,
+    pending_audio: Optional[bytes],
+    voices: Mapping[str, str],
+    current_voice: str,
+    current_speed: int,
+    on_voice_change: Callable[[str], None],
+    on_speed_change: Callable[[int], None],
+    on_audio: Callable[[bytes], tuple[bool, Optional[str]]],
+    on_audio_handled: Callable[[], None],
+    on_text: Callable[[str], Any],
+    quick_prompts: Mapping[str, str],
+):
+    """
+    Render the full voice column: voice panel, typed input and quick prompts.
+
+    Shared by the discovery, cooking and planning pages so the three
+    columns stay identical.
+
+    Args:
+        key_prefix: Widget key prefix for this page (e.g. "cooking")
+        audio_key: Unique key for the audio input widget
+        pending_audio: One-shot audio bytes to play (if any)
+        voices: Dict of {voice_id: display_name}
+        current_voice: Currently selected voice ID
+        current_speed: Current speed slider value (-2 to +4)
+        on_voice_change: Callback when voice changes (receives voice_id)
+        on_speed_change: Callback when speed changes (receives slider value)
+        on_audio: Handles a recording, returns (success, error)
+        on_audio_handled: Resets the audio input after a recording is handled
+        on_text: Queues a typed or quick-prompt message
+        quick_prompts: Dict of {button label: message sent}
+    """
+    # Header outside container to match chat layout
+    st.markdown("### Voice Controls")
+
+    # Wrap all controls in container to match chat container height. The
+    # style is emitted every run: skipping it would drop it from the page.
+    st.markdown(VOICE_CONTROLS_STYLE, unsafe_allow_html=True)
+    voice_container = st.container(border=True, key=VOICE_CONTROLS_KEY)
+    with voice_container:
+        # Voice input
+        audio_bytes = render_voice_panel(
+            audio_key=audio_key,
+            pending_audio=pending_audio,
+            voices=voices,
+            current_voice=current_voice,
+            current_speed=current_speed,
+            on_voice_change=on_voice_change,
+            on_speed_change=on_speed_change,
+        )
+
+        if audio_bytes:
+            with st.spinner("Transcribing..."):
+                success, error = on_audio(audio_bytes)
+
+            # Each recording is handled once: reset the mic widget whether
+            # or not it worked so a failed clip isn't re-sent every rerun
+            on_audio_handled()
+            if success:
+                # A transcript is queued for the chat column, which has
+                # already rendered this run - so rerun to stream the reply
+                st.rerun()
+            elif error:
+                st.warning(error)
+
+        # Text input as alternative - chat_input clears itself on submit, and
+        # on_submit queues the message before the chat renders on this run
+        st.divider()
+        st.markdown("**Or type:**")
+        text_key = f"{key_prefix}_text_input"
+        st.chat_input(
+            "Type here...",
+            key=text_key,
+            on_submit=_submit_text,
+            args=(text_key, on_text),
+        )
+
+        # Quick prompts - one segmented control; on_change runs before the
+        # rerun the click triggers, so no second st.rerun() is needed
+        st.divider()
+        prompts_key = f"{key_prefix}_quick_prompts"
+        st.segmented_control(
+            "**Quick prompts:**",
+            options=list(quick_prompts),
+            default=None,
+            key=prompts_key,
+            on_change=_submit_quick_prompt,
+            args=(prompts_key, quick_prompts, on_text),
+        )
+
+
+def _submit_text(key: str, on_text: Callable[[str], Any]):
+    """Pass the submitted chat_input message on."""
+    text = st.session_state[key]
+    if text:
+        on_text(text)
+
+
+def _submit_quick_prompt(
+    key: str,
+    quick_prompts: Mapping[str, str],
+    on_text: Callable[[str], Any],
+):
+    """Send the chosen quick prompt and clear the selection for reuse."""
+    choice = st.session_state[key]
+    st.session_state[key] = None
+    if choice:
+        on_text(quick_prompts[choice])
 
+
+@st.fragment
+def _render_voice_settings(
+    voices: Mapping[str, str],
+    current_voice: str,
+    current_speed: int,
+    on_voice_change: Callable[[str], None],
+    on_speed_change: Callable[[int], None],
+):
+    """
+    Render the voice selector and speed slider as an isolated fragment.
+
+    Changing either setting reruns only this fragment, not the chat history
+    and the rest of the page. Changes are reported through on_change
+    callbacks because a fragment rerun reuses the arguments from the last
+    full run, so current_voice/current_speed may be stale here.
+    """
     # Voice selector
     st.markdown("**Voice**")
-    voice_ids = list(voices.keys())
-    voice_names = list(voices.values())
+    voice_ids, voice_names, id_to_idx, name_to_idx = _voices_arrays(
+        tuple(voices.items())
+    )
 
-    # Get current index
-    current_idx = 0
-    if current_voice in voice_ids:
-        current_idx = voice_ids.index(current_voice)
+    def handle_voice_select():
+        selected_name = st.session_state.voice_panel_voice
+        on_voice_change(voice_ids[name_to_idx[selected_name]])
 
-    selected_name = st.selectbox(
+    st.selectbox(
         "Select voice:",
         options=voice_names,
-        index=current_idx,
+        index=id_to_idx.get(current_voice, 0),
         label_visibility="collapsed",
-        key="voice_panel_voice"
+        key="voice_panel_voice",
+        on_change=handle_voice_select,
     )
 
-    # Map back to voice ID
-    selected_idx = voice_names.index(selected_name)
-    selected_voice_id = voice_ids[selected_idx]
-
-    if selected_voice_id != current_voice:
-        on_voice_change(selected_voice_id)
-
     # Speed slider
     st.markdown("**Speed**")
 
-    # Get the label for current speed
-    speed_label = SPEED_LABELS.get(current_speed, "Normal")
+    def handle_speed_change():
+        on_speed_change(st.session_state.voice_panel_speed)
 
     selected_speed = st.slider(
         "Playback speed",
@@ -128,13 +296,9 @@ def render_voice_panel(
         format="%d",
         label_visibility="collapsed",
         key="voice_panel_speed",
-        help="Adjust voice playback speed"
+        help="Adjust voice playback speed",
+        on_change=handle_speed_change,
     )
 
     # Show the speed label
-    st.caption(f"Speed: {SPEED_LABELS.get(selected_speed, 'Normal')}")
-
-    if selected_speed != current_speed:
-        on_speed_change(selected_speed)
-
-    return recorded_bytes
+    st.caption(f"Speed: {_speed_label(selected_speed)}")
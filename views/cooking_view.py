@@ -6,18 +6,59 @@ It delegates business logic to the CookingController.
 """
 
 import streamlit as st
+from collections.abc import Iterator
+from typing import Optional
 
 from controllers.cooking_controller import CookingController
+from services.recipe_service import RecipeSummary
 from views.components.chat import render_chat_messages
-from views.components.voice_panel import render_voice_panel
+from views.components.voice_panel import render_voice_controls
 from views.components.sidebar import render_cooking_sidebar
 
 
+# Quick prompts as {button label: message sent}
+DISCOVERY_QUICK_PROMPTS = {
+    "Something quick": "I want something quick and easy",
+    "Comfort food": "I'm in the mood for comfort food",
+    "Surprise me!": "Surprise me with a recommendation!",
+}
+
+COOKING_QUICK_PROMPTS = {
+    "What's next?": "What's the next step?",
+    "Can I substitute?": "What substitutions can I make?",
+    "How long left?": "How much time is left?",
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _cooking_controller() -> CookingController:
+    """Shared controller; all per-user state lives in st.session_state."""
+    return CookingController()
+
+
+@st.cache_resource(show_spinner=False)
+def _voice_catalog(_controller: CookingController) -> dict[str, str]:
+    """Static voice catalog, built once per process. Do not mutate."""
+    return _controller.get_available_voices()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_recipes(_controller: CookingController) -> list[RecipeSummary]:
+    """Recipe summaries, shared across sessions and refreshed every minute."""
+    return _controller.get_recipes()
+
+
+def _format_recipe_option(name: str) -> str:
+    """Selectbox label for a recipe option ("" is the placeholder)."""
+    return name or "Select a recipe..."
+
+
 class CookingView:
     """View for cooking session UI."""
 
     def __init__(self):
-        self.controller = CookingController()
+        self.controller = _cooking_controller()
+        self.controller.init_session()
 
     def render(self):
         """Main render method - displays appropriate UI based on state."""
@@ -34,21 +75,21 @@ class CookingView:
         """Render recipe selection screen."""
         st.markdown("### Select a Recipe")
 
-        recipes = self.controller.get_recipes()
+        recipes = _cached_recipes(self.controller)
 
         if not recipes:
             st.warning("No recipes found. Add some recipes to the database.")
             return
 
-        recipe_options = {r.name: r.id for r in recipes}
+        recipes_by_name = {r.name: r for r in recipes}
         selected_name = st.selectbox(
             "Choose what to cook:",
-            options=[""] + list(recipe_options.keys()),
-            format_func=lambda x: "Select a recipe..." if x == "" else x
+            options=[""] + list(recipes_by_name.keys()),
+            format_func=_format_recipe_option
         )
 
         if selected_name:
-            recipe = next(r for r in recipes if r.name == selected_name)
+            recipe = recipes_by_name[selected_name]
             st.markdown(f"""
             **{recipe.description or 'No description'}**
 
@@ -56,7 +97,7 @@ class CookingView:
             """)
 
             if st.button("Start Cooking", type="primary", use_container_width=True):
-                if self.controller.start_session(recipe_options[selected_name]):
+                if self.controller.start_session(recipe.id):
                     st.rerun()
                 else:
                     st.error("Failed to start cooking session.")
@@ -65,6 +106,7 @@ class CookingView:
         """Render the chat-first discovery interface."""
         # Initialize discovery with greeting if needed
         self.controller.init_discovery()
+        messages = self.controller.get_discovery_messages()
 
         st.markdown("Let's find something to cook!")
 
@@ -72,79 +114,43 @@ class CookingView:
         chat_col, voice_col = st.columns([3, 1])
 
         with chat_col:
-            # Display discovery chat messages
-            messages = self.controller.get_discovery_messages()
-            render_chat_messages(messages)
+            # Display discovery chat messages, streaming any queued reply
+            render_chat_messages(messages, reply=self.controller.take_pending_reply())
+
+        # Claude picked a recipe while replying - switch to the cooking session
+        if self.controller.is_session_active():
+            st.rerun()
 
         with voice_col:
             self._render_discovery_voice_panel()
 
     def _render_discovery_voice_panel(self):
         """Render voice control panel for discovery mode."""
-        # Header outside container to match chat layout
-        st.markdown("### Voice Controls")
-
-        # Wrap all controls in container to match chat container height
-        voice_container = st.container(height=450)
-        with voice_container:
-            # Voice input
-            audio_bytes = render_voice_panel(
-                audio_key=self.controller.get_audio_key(),
-                pending_audio=self.controller.get_pending_audio(),
-                voices=self.controller.get_available_voices(),
-                current_voice=self.controller.get_voice_name(),
-                current_speed=self.controller.get_speed_slider_value(),
-                on_voice_change=self.controller.set_voice_name,
-                on_speed_change=self.controller.set_speed_from_slider,
-            )
-
-            if audio_bytes:
-                with st.spinner("Transcribing..."):
-                    success, error = self.controller.handle_discovery_voice_input(audio_bytes)
-
-                if success:
-                    self.controller.increment_audio_key()
-                    st.rerun()
-                elif error:
-                    st.warning(error)
-
-            # Text input as alternative
-            st.markdown("---")
-            st.markdown("**Or type:**")
-            user_input = st.text_input(
-                "Type your message",
-                key="discovery_text_input",
-                placeholder="Type here...",
-                label_visibility="collapsed"
-            )
-
-            if user_input:
-                with st.spinner("Thinking..."):
-                    self.controller.send_discovery_message(user_input)
-                st.rerun()
-
-            # Quick prompts for discovery
-            st.markdown("---")
-            st.markdown("**Quick prompts:**")
-
-            if st.button("Something quick", use_container_width=True, key="qp_quick_disc"):
-                self.controller.send_discovery_message("I want something quick and easy")
-                st.rerun()
-
-            if st.button("Comfort food", use_container_width=True, key="qp_comfort"):
-                self.controller.send_discovery_message("I'm in the mood for comfort food")
-                st.rerun()
-
-            if st.button("Surprise me!", use_container_width=True, key="qp_surprise"):
-                self.controller.send_discovery_message("Surprise me with a recommendation!")
-                st.rerun()
+        render_voice_controls(
+            key_prefix="discovery",
+            audio_key=self.controller.get_audio_key(),
+            pending_audio=self.controller.get_pending_audio(),
+            voices=_voice_catalog(self.controller),
+            current_voice=self.controller.get_voice_name(),
+            current_speed=self.controller.get_speed_slider_value(),
+            on_voice_change=self.controller.set_voice_name,
+            on_speed_change=self.controller.set_speed_from_slider,
+            on_audio=self.controller.handle_voice_input,
+            on_audio_handled=self.controller.increment_audio_key,
+            on_text=self.controller.queue_message,
+            quick_prompts=DISCOVERY_QUICK_PROMPTS,
+        )
 
     def _render_cooking_session(self):
         """Render active cooking session."""
+        # Read session state once and thread it through the regions below
+        recipe_name = self.controller.get_recipe_name()
+        messages = self.controller.get_messages()
+
         # Sidebar (without voice settings)
         render_cooking_sidebar(
-            recipe_name=self.controller.get_recipe_name(),
-            on_text_submit=self.controller.send_message,
+            recipe_name=recipe_name,
+            on_text_submit=self.controller.queue_message,
             on_end_session=self.controller.end_session,
         )
 
@@ -152,71 +158,33 @@ class CookingView:
         chat_col, voice_col = st.columns([3, 1])
 
         with chat_col:
-            self._render_chat_area()
+            self._render_chat_area(messages, self.controller.take_pending_reply())
 
         with voice_col:
             self._render_voice_panel()
 
-    def _render_chat_area(self):
-        """Render main chat area with messages."""
+    def _render_chat_area(
+        self,
+        messages: list[dict],
+        reply: Optional[tuple[str, Iterator[str]]],
+    ):
+        """Render main chat area with messages and any streaming reply."""
         # Display chat messages in scrollable container (header is in component)
-        render_chat_messages(self.controller.get_messages())
+        render_chat_messages(messages, reply=reply)
 
     def _render_voice_panel(self):
         """Render voice control panel."""
-        # Header outside container to match chat layout
-        st.markdown("### Voice Controls")
-
-        # Wrap controls in container to match chat container height
-        voice_container = st.container(height=450)
-        with voice_container:
-            audio_bytes = render_voice_panel(
-                audio_key=self.controller.get_audio_key(),
-                pending_audio=self.controller.get_pending_audio(),
-                voices=self.controller.get_available_voices(),
-                current_voice=self.controller.get_voice_name(),
-                current_speed=self.controller.get_speed_slider_value(),
-                on_voice_change=self.controller.set_voice_name,
-                on_speed_change=self.controller.set_speed_from_slider,
-            )
-
-            if audio_bytes:
-                with st.spinner("Transcribing..."):
-                    success, error = self.controller.handle_voice_input(audio_bytes)
-
-                if success:
-                    self.controller.increment_audio_key()
-                    st.rerun()
-                elif error:
-                    st.warning(error)
-
-            # Text input as alternative
-            st.markdown("---")
-            st.markdown("**Or type:**")
-            user_input = st.text_input(
-                "Type your message",
-                key="cooking_text_input",
-                placeholder="Type here...",
-                label_visibility="collapsed"
-            )
-
-            if user_input:
-                with st.spinner("Thinking..."):
-                    self.controller.send_message(user_input)
-                st.rerun()
-
-            # Quick prompts (cooking-specific)
-            st.markdown("---")
-            st.markdown("**Quick prompts:**")
-
-            if st.button("What's next?", use_container_width=True, key="qp_next"):
-                self.controller.send_message("What's the next step?")
-                st.rerun()
-
-            if st.button("Can I substitute?", use_container_width=True, key="qp_substitute"):
-                self.controller.send_message("What substitutions can I make?")
-                st.rerun()
-
-            if st.button("How long left?", use_container_width=True, key="qp_time"):
-                self.controller.send_message("How much time is left?")
-                st.rerun()
+        render_voice_controls(
+            key_prefix="cooking",
+            audio_key=self.controller.get_audio_key(),
+            pending_audio=self.controller.get_pending_audio(),
+            voices=_voice_catalog(self.controller),
+            current_voice=self.controller.get_voice_name(),
+            current_speed=self.controller.get_speed_slider_value(),
+            on_voice_change=self.controller.set_voice_name,
+            on_speed_change=self.controller.set_speed_from_slider,
+            on_audio=self.controller.handle_voice_input,
+            on_audio_handled=self.controller.increment_audio_key,
+            on_text=self.controller.queue_message,
+            quick_prompts=COOKING_QUICK_PROMPTS,
+        )
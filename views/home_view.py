@@ -15,7 +15,7 @@ class HomeView:
         st.title("Cooking Assistant")
         st.markdown("Your AI-powered kitchen companion")
 
-        st.markdown("---")
+        st.divider()
 
         col1, col2 = st.columns(2)
 
@@ -25,7 +25,7 @@ class HomeView:
         with col2:
             self._render_plan_card()
 
-        st.markdown("---")
+        st.divider()
         st.markdown("*Use the sidebar to navigate between pages.*")
 
     def _render_cook_card(self) -> None:
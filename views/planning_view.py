@@ -8,16 +8,62 @@ It delegates business logic to the PlanningController.
 import streamlit as st
 
 from controllers.planning_controller import PlanningController
+from services.recipe_service import RecipeSummary
 from views.components.chat import render_chat_messages
-from views.components.voice_panel import render_voice_panel
+from views.components.voice_panel import render_voice_controls
 from views.components.sidebar import render_planning_sidebar
 
 
+# Quick prompts as {button label: message sent}
+PLANNING_QUICK_PROMPTS = {
+    "Healthy meals": "I want healthy, nutritious meals",
+    "Quick & easy": "I need quick meals under 30 minutes",
+    "Special occasion": "I'm planning for a special occasion",
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _planning_controller() -> PlanningController:
+    """Shared controller; all per-user state lives in st.session_state."""
+    return PlanningController()
+
+
+@st.cache_resource(show_spinner=False)
+def _voice_catalog(_controller: PlanningController) -> dict[str, str]:
+    """Static voice catalog, built once per process. Do not mutate."""
+    return _controller.get_available_voices()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_recipe_options(
+    _controller: PlanningController,
+) -> tuple[list[str], dict[str, int]]:
+    """
+    Quick Add selectbox options, shared across sessions and refreshed every minute.
+
+    Returns:
+        (options with a leading "" placeholder, {recipe_name: recipe_id})
+    """
+    recipes = _controller.get_all_recipes()
+    return [""] + [r.name for r in recipes], {r.name: r.id for r in recipes}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_selected_recipes(
+    _controller: PlanningController,
+    recipe_ids: tuple[int, ...],
+) -> list[RecipeSummary]:
+    """Details for the given recipe IDs, in catalog order."""
+    selected = set(recipe_ids)
+    return [r for r in _controller.get_all_recipes() if r.id in selected]
+
+
 class PlanningView:
     """View for meal planning UI."""
 
     def __init__(self):
-        self.controller = PlanningController()
+        self.controller = _planning_controller()
+        self.controller.init_session()
 
     def render(self):
         """Main render method."""
@@ -27,27 +73,30 @@ class PlanningView:
         # Sidebar with recipe selection and plan summary (no voice settings)
         self._render_sidebar()
 
-        # Start conversation if empty
+        # Start conversation if empty - the opening reply streams into the
+        # chat below on this same run, so no rerun is needed
         messages = self.controller.get_messages()
         if not messages:
-            with st.spinner("Starting conversation..."):
-                self.controller.start_conversation()
-                st.rerun()
+            self.controller.start_conversation()
 
         # Two-column layout: Chat on left, Voice Panel on right
         chat_col, voice_col = st.columns([3, 1])
 
         with chat_col:
-            self._render_chat_area()
+            self._render_chat_area(messages)
 
         with voice_col:
             self._render_voice_panel()
 
     def _render_sidebar(self):
         """Render sidebar without voice settings."""
+        recipe_options, recipe_ids = _cached_recipe_options(self.controller)
         render_planning_sidebar(
-            selected_recipes=self.controller.get_selected_recipe_details(),
-            all_recipes=self.controller.get_all_recipes(),
+            selected_recipes=_cached_selected_recipes(
+                self.controller, tuple(self.controller.get_selected_recipes())
+            ),
+            recipe_options=recipe_options,
+            recipe_ids=recipe_ids,
             is_confirmed=self.controller.is_plan_confirmed(),
             shopping_list_id=self.controller.get_shopping_list_id(),
             on_remove_recipe=self.controller.remove_recipe_from_plan,
@@ -56,67 +105,31 @@ class PlanningView:
             on_clear=self.controller.clear_conversation,
         )
 
-    def _render_chat_area(self):
-        """Render main chat area with messages only."""
+    def _render_chat_area(self, messages: list[dict]):
+        """Render main chat area with messages and any streaming reply."""
         # Display chat messages using component
-        render_chat_messages(self.controller.get_messages())
+        render_chat_messages(
+            messages,
+            reply=self.controller.take_pending_reply(),
+        )
+
+        # Claude added recipes while replying - redraw the plan sidebar
+        if self.controller.take_plan_updated():
+            st.rerun()
 
     def _render_voice_panel(self):
         """Render voice control panel with all input methods."""
-        # Header outside container to match chat layout
-        st.markdown("### Voice Controls")
-
-        # Wrap all controls in container to match chat container height
-        voice_container = st.container(height=450)
-        with voice_container:
-            # Voice input
-            audio_bytes = render_voice_panel(
-                audio_key=self.controller.get_audio_key(),
-                pending_audio=self.controller.get_pending_audio(),
-                voices=self.controller.get_available_voices(),
-                current_voice=self.controller.get_voice_name(),
-                current_speed=self.controller.get_speed_slider_value(),
-                on_voice_change=self.controller.set_voice_name,
-                on_speed_change=self.controller.set_speed_from_slider,
-            )
-
-            if audio_bytes:
-                with st.spinner("Transcribing..."):
-                    success, error = self.controller.handle_voice_input(audio_bytes)
-
-                if success:
-                    self.controller.increment_audio_key()
-                    st.rerun()
-                elif error:
-                    st.warning(error)
-
-            # Text input as alternative
-            st.markdown("---")
-            st.markdown("**Or type:**")
-            user_input = st.text_input(
-                "Type your message",
-                key="planning_text_input",
-                placeholder="Type here...",
-                label_visibility="collapsed"
-            )
-
-            if user_input:
-                with st.spinner("Thinking..."):
-                    self.controller.send_message(user_input)
-                st.rerun()
-
-            # Quick prompts (stacked vertically for narrow column)
-            st.markdown("---")
-            st.markdown("**Quick prompts:**")
-
-            if st.button("Healthy meals", use_container_width=True, key="qp_healthy"):
-                self.controller.send_message("I want healthy, nutritious meals")
-                st.rerun()
-
-            if st.button("Quick & easy", use_container_width=True, key="qp_quick"):
-                self.controller.send_message("I need quick meals under 30 minutes")
-                st.rerun()
-
-            if st.button("Special occasion", use_container_width=True, key="qp_special"):
-                self.controller.send_message("I'm planning for a special occasion")
-                st.rerun()
+        render_voice_controls(
+            key_prefix="planning",
+            audio_key=self.controller.get_audio_key(),
+            pending_audio=self.controller.get_pending_audio(),
+            voices=_voice_catalog(self.controller),
+            current_voice=self.controller.get_voice_name(),
+            current_speed=self.controller.get_speed_slider_value(),
+            on_voice_change=self.controller.set_voice_name,
+            on_speed_change=self.controller.set_speed_from_slider,
+            on_audio=self.controller.handle_voice_input,
+            on_audio_handled=self.controller.increment_audio_key,
+            on_text=self.controller.queue_message,
+            quick_prompts=PLANNING_QUICK_PROMPTS,
+        )
@@ -10,18 +10,61 @@ This view handles:
 """
 
 import streamlit as st
+from collections import defaultdict
+from functools import partial
+from typing import Any, Collection, Optional
 
-from controllers.shopping_controller import ShoppingController, PriceComparisonResult
+from controllers.shopping_controller import ShoppingController, ShoppingListSummary
 from views.components.sidebar import render_shopping_list_sidebar
 from views.components.shopping_item import (
     render_shopping_table_header,
     render_category_section,
     render_removed_section,
+    render_shopping_items_grouped,
 )
 from views.components.shopping_stats import render_shopping_stats
 from views.components.share import render_email_share, render_link_share
 
 
+def _count_items(
+    items: list[Any],
+    exclude: Collection[int] = (),
+) -> tuple[int, int]:
+    """Return (total, checked) for items not in exclude, in a single pass."""
+    total = checked = 0
+    for item in items:
+        if item.ShoppingListItemId in exclude:
+            continue
+        total += 1
+        if item.IsChecked:
+            checked += 1
+    return total, checked
+
+
+# Cached reads - shared by every session and keyed on per-list (or per-user)
+# write versions, so a write from any session refetches just what it changed.
+# The TTL bounds staleness from other app processes, and max_entries caps the
+# superseded snapshots each bump leaves behind
+@st.cache_data(ttl=60, max_entries=100, show_spinner=False)
+def _cached_lists(
+    _controller: ShoppingController,
+    user_id: Optional[str],
+    version: int,
+) -> list[ShoppingListSummary]:
+    """The user's active list summaries."""
+    return _controller.get_all_lists()
+
+
+@st.cache_data(ttl=60, max_entries=100, show_spinner=False)
+def _cached_list(
+    _controller: ShoppingController,
+    list_id: int,
+    version: int,
+) -> Optional[Any]:
+    """A shopping list with its items loaded."""
+    return _controller.get_list(list_id)
+
+
 class ShoppingView:
     """View for shopping list UI."""
 
@@ -43,7 +86,13 @@ class ShoppingView:
 
     def _render_list_selector(self):
         """Render list selection and management."""
-        lists = self.controller.get_all_lists()
+        user = self.controller.get_current_user()
+        user_id = user.user_id if user else None
+        lists = _cached_lists(
+            self.controller,
+            user_id,
+            self.controller.get_lists_version(user_id),
+        )
 
         if not lists:
             st.info("No shopping lists yet. Go to **Plan Meals** to create one!")
@@ -67,7 +116,8 @@ class ShoppingView:
 
     def _render_shopping_list(self, list_id: int):
         """Render a shopping list with unified pricing table."""
-        shopping_list = self.controller.get_list(list_id)
+        version = self.controller.get_list_version(list_id)
+        shopping_list = _cached_list(self.controller, list_id, version)
 
         if not shopping_list:
             st.error("Shopping list not found")
@@ -76,35 +126,57 @@ class ShoppingView:
         # Header
         st.markdown(f"### {shopping_list.Name or 'Shopping List'}")
 
+        self._render_list_body(list_id)
+
+    @st.fragment
+    def _render_list_body(self, list_id: int):
+        """
+        Render stats, share section and items for a list.
+
+        Item widgets use callbacks, so ticking, removing or picking a
+        product reruns only this fragment - not the sidebar or header.
+        Ticks are buffered by the callbacks and saved together here.
+        """
+        self.controller.flush_checks()
+        version = self.controller.get_list_version(list_id)
+        shopping_list = _cached_list(self.controller, list_id, version)
+        if not shopping_list:
+            return
+
         items = shopping_list.items or []
         removed_items = self.controller.get_removed_items(list_id)
-        active_items = [i for i in items if i.ShoppingListItemId not in removed_items]
+        total_active, checked = _count_items(items, exclude=removed_items)
 
         # Stats row with pricing
-        self._render_stats_and_pricing(list_id, items, active_items, removed_items)
+        self._render_stats_and_pricing(
+            list_id, total_active, checked, len(removed_items)
+        )
 
-        st.markdown("---")
+        st.divider()
 
         # Share section (collapsed)
         with st.expander("Share List", expanded=False):
             self._render_share_section(list_id)
 
-        st.markdown("---")
+        st.divider()
 
         # Table header
         render_shopping_table_header()
 
         # Get price info and selected products for rendering
         cached_prices = self.controller.get_cached_prices(list_id)
-        price_info_map = {}
-        if cached_prices and cached_prices.success:
-            for item_info in cached_prices.items:
-                price_info_map[item_info.item_id] = item_info
+        price_info_map = (
+            {info.item_id: info for info in cached_prices.items}
+            if cached_prices and cached_prices.success
+            else {}
+        )
 
         selected_products = st.session_state.shopping.get("selected_products", {})
 
-        # Items grouped by category
-        grouped = self.controller.get_items_grouped(list_id)
+        # Items grouped by category - from the cached list, which already
+        # holds them in SortOrder, rather than a second query for the same rows
+        grouped = self._group_items_by_category(items)
+        on_remove = partial(self.controller.remove_item, list_id)
 
         for category, category_items in grouped.items():
             render_category_section(
@@ -113,8 +185,8 @@ class ShoppingView:
                 price_info_map=price_info_map,
                 selected_products=selected_products,
                 removed_items=removed_items,
-                on_check_change=self.controller.check_item,
-                on_remove=lambda item_id: self.controller.remove_item(list_id, item_id),
+                on_check_change=partial(self.controller.queue_check, list_id),
+                on_remove=on_remove,
                 on_product_select=self.controller.set_selected_product,
             )
 
@@ -122,21 +194,17 @@ class ShoppingView:
         render_removed_section(
             all_items=items,
             removed_items=removed_items,
-            on_restore=lambda item_id: self.controller.restore_item(list_id, item_id),
+            on_restore=partial(self.controller.restore_item, list_id),
         )
 
     def _render_stats_and_pricing(
         self,
         list_id: int,
-        all_items: list,
-        active_items: list,
-        removed_items: set,
+        total_active: int,
+        checked: int,
+        removed_count: int,
     ):
         """Render stats row with integrated pricing controls."""
-        total_active = len(active_items)
-        checked = sum(1 for i in active_items if i.IsChecked)
-        removed_count = len(removed_items)
-
         # Get cached prices
         cached_prices = self.controller.get_cached_prices(list_id)
         has_prices = cached_prices and cached_prices.success
@@ -198,15 +266,22 @@ class ShoppingView:
             self.controller.set_cached_prices(list_id, result)
             st.rerun()
 
+    @st.fragment
     def _render_share_section(self, list_id: int):
-        """Render the share/send section."""
+        """Render the share/send section (typing and sending rerun only this)."""
         tab1, tab2 = st.tabs(["Send via Email", "Copy Link"])
 
+        # The configured check is cached; issues are only listed when it fails
+        email_configured = self.controller.is_email_configured()
+
         with tab1:
             render_email_share(
                 list_id=list_id,
-                is_configured=self.controller.is_email_configured(),
-                config_issues=self.controller.get_email_config_issues(),
+                is_configured=email_configured,
+                config_issues=(
+                    [] if email_configured
+                    else self.controller.get_email_config_issues()
+                ),
                 validate_email=self.controller.validate_email,
                 send_email=self.controller.send_list_via_email,
             )
@@ -231,70 +306,43 @@ class ShoppingView:
         st.markdown(f"### {shopping_list.Name or 'Shopping List'}")
         st.caption("Shared shopping list")
 
-        # Stats
-        items = shopping_list.items or []
-        total = len(items)
-        checked = sum(1 for i in items if i.IsChecked)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Items", total)
-        with col2:
-            st.metric("Remaining", total - checked)
+        self._render_shared_list_body(shopping_list.ShoppingListId)
 
-        st.progress(checked / total if total > 0 else 0)
-        st.markdown("---")
+    @st.fragment
+    def _render_shared_list_body(self, list_id: int):
+        """
+        Render stats and items for a shared list.
 
-        # For shared lists, use simple grouped view (no pricing)
-        grouped_items = self._group_items_by_category(items)
-
-        for category, category_items in grouped_items.items():
-            st.markdown(f"#### {category}")
-            for item in category_items:
-                self._render_simple_item(item)
-            st.markdown("")
-
-    def _render_simple_item(self, item):
-        """Render a simple item row for shared lists."""
-        ingredient_name = item.ingredient.Name if item.ingredient else "Unknown"
-        quantity = item.AggregatedQuantity or ""
-
-        col1, col2 = st.columns([1, 5])
-
-        with col1:
-            checked = st.checkbox(
-                "checked",
-                value=item.IsChecked,
-                key=f"shared_item_{item.ShoppingListItemId}",
-                label_visibility="collapsed"
-            )
+        The link has already been validated by the caller, so ticking an
+        item reruns only this fragment and reads the list from the cache.
+        """
+        # Save any ticks buffered by the table callbacks before reading
+        self.controller.flush_checks()
+        version = self.controller.get_list_version(list_id)
+        shopping_list = _cached_list(self.controller, list_id, version)
+        if not shopping_list:
+            return
 
-            if checked != item.IsChecked:
-                self.controller.check_item(item.ShoppingListItemId, checked)
-                st.rerun()
+        # Stats
+        items = shopping_list.items or []
+        total, checked = _count_items(items)
+        render_shopping_stats(total, checked)
+        st.divider()
 
-        with col2:
-            if item.IsChecked:
-                st.markdown(f"~~{ingredient_name}~~ {quantity}")
-            else:
-                st.markdown(f"**{ingredient_name}** {quantity}")
+        # For shared lists, use simple grouped view (no pricing)
+        render_shopping_items_grouped(
+            self._group_items_by_category(items),
+            on_check_change=partial(self.controller.queue_check, list_id),
+        )
 
     def _group_items_by_category(self, items) -> dict:
-        """Group items by category with proper ordering."""
-        grouped = {}
+        """
+        Group items by category.
+
+        Items arrive ordered by SortOrder (category rank first), so
+        categories keep that store-walk order without a sort here.
+        """
+        grouped = defaultdict(list)
         for item in items:
-            category = item.Category or "Other"
-            if category not in grouped:
-                grouped[category] = []
-            grouped[category].append(item)
-
-        # Sort categories
-        category_order = {
-            "Produce": 1, "Meat & Seafood": 2, "Dairy & Eggs": 3,
-            "Bakery": 4, "Grains & Pasta": 5, "Canned & Jarred": 6,
-            "Pantry": 7, "Spices": 8, "Other": 99
-        }
-        return {
-            k: grouped[k]
-            for k in sorted(grouped.keys(), key=lambda x: category_order.get(x, 50))
-        }
+            grouped[item.Category or "Other"].append(item)
+        return dict(grouped)